@@ -1,479 +1,668 @@
-"""
-PDF Processor - Adds background border layers without touching original content
-"""
-
-import os
-import fitz  # PyMuPDF
-import tempfile
-import io
-from pathlib import Path
-from PIL import Image, ImageEnhance, ImageDraw
-import numpy as np
-from datetime import datetime
-
-from core.image_processor import ImageProcessor
-
-class PDFProcessor:
-    """Main PDF processing class - background border approach"""
-    
-    def __init__(self, settings):
-        self.settings = settings
-        self.image_processor = ImageProcessor(settings)
-        
-    def process_pdf(self, input_path):
-        """
-        Main method to process a PDF file and add background borders
-        
-        Args:
-            input_path (str): Path to input PDF file
-            
-        Returns:
-            str: Path to output PDF file
-        """
-        print(f"Starting BACKGROUND BORDER processing: {Path(input_path).name}")
-        
-        # Generate output path
-        output_path = self._generate_output_path(input_path)
-        
-        # Create backup if requested
-        if self.settings.get('backup_original', True):
-            self._create_backup(input_path)
-        
-        # Open PDF document
-        doc = fitz.open(input_path)
-        
-        try:
-            # Process each page
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-                
-                # Find center image on page
-                center_image = self._find_center_image(page)
-                
-                if center_image:
-                    print(f"Processing page {page_num + 1}: Found center image")
-                    
-                    # Generate border content from image
-                    border_content = self._generate_border_content(page, center_image)
-                    
-                    # Add border as BACKGROUND layer (don't touch original)
-                    self._add_background_border_layer(page, center_image, border_content)
-                    
-                else:
-                    print(f"Page {page_num + 1}: No center image found, skipping")
-            
-            # Save processed PDF
-            doc.save(output_path, garbage=4, deflate=True)
-            print(f"✓ Saved processed PDF: {Path(output_path).name}")
-            
-            # Add metadata if requested
-            if self.settings.get('add_processing_info', False):
-                self._add_processing_metadata(output_path)
-            
-            return output_path
-            
-        finally:
-            doc.close()
-    
-    def extract_first_page_image(self, pdf_path):
-        """
-        Extract first page as image for preview
-        
-        Args:
-            pdf_path (str): Path to PDF file
-            
-        Returns:
-            PIL.Image: First page as image
-        """
-        doc = fitz.open(pdf_path)
-        try:
-            page = doc[0]
-            
-            # Render page to image
-            dpi = self.settings.get('output_dpi', 300)
-            mat = fitz.Matrix(dpi/72, dpi/72)
-            pix = page.get_pixmap(matrix=mat)
-            
-            # Convert to PIL Image
-            img_data = pix.tobytes("ppm")
-            image = Image.open(io.BytesIO(img_data))
-            
-            return image
-            
-        finally:
-            doc.close()
-    
-    def create_preview(self, pdf_path):
-        """
-        Create preview of processed image showing the full page result
-        
-        Args:
-            pdf_path (str): Path to PDF file
-            
-        Returns:
-            PIL.Image: Preview image showing full page with borders
-        """
-        doc = fitz.open(pdf_path)
-        try:
-            page = doc[0]
-            
-            # Find center image
-            center_image = self._find_center_image(page)
-            
-            if center_image:
-                # Render original page to image first
-                dpi = self.settings.get('output_dpi', 300)
-                mat = fitz.Matrix(dpi/72, dpi/72)
-                pix = page.get_pixmap(matrix=mat)
-                
-                # Convert to PIL Image
-                img_data = pix.tobytes("ppm")
-                original_page_image = Image.open(io.BytesIO(img_data))
-                
-                # Get original image for border generation
-                original_image = self._extract_image_from_page(page, center_image)
-                
-                # Generate border content
-                border_width_mm = self.settings.get('border_width_mm', 3)
-                border_content = self.image_processor.generate_border_content(
-                    original_image, border_width_mm, dpi)
-                
-                # Calculate placement on page
-                original_rect = center_image['rect']
-                page_rect = page.rect
-                
-                # Convert PDF coordinates to image coordinates
-                scale_x = original_page_image.width / page_rect.width
-                scale_y = original_page_image.height / page_rect.height
-                
-                # Calculate border placement in image coordinates
-                border_width_points = self._mm_to_points(border_width_mm)
-                
-                # Original image position in page coordinates
-                orig_center_x = (original_rect.x0 + original_rect.x1) / 2
-                orig_center_y = (original_rect.y0 + original_rect.y1) / 2
-                orig_width = original_rect.x1 - original_rect.x0
-                orig_height = original_rect.y1 - original_rect.y0
-                
-                # Border content dimensions in page coordinates
-                border_width_page = orig_width + (2 * border_width_points)
-                border_height_page = orig_height + (2 * border_width_points)
-                
-                # Convert to image coordinates
-                border_x = int((orig_center_x - border_width_page/2) * scale_x)
-                border_y = int((orig_center_y - border_height_page/2) * scale_y)
-                border_w = int(border_width_page * scale_x)
-                border_h = int(border_height_page * scale_y)
-                
-                # Create result image (copy of original page)
-                result_image = original_page_image.copy()
-                
-                # Resize border content to fit placement area
-                border_content_resized = border_content.resize((border_w, border_h), Image.Resampling.LANCZOS)
-                
-                # Paste border content onto page (as background)
-                # Ensure we don't go outside image bounds
-                paste_x = max(0, border_x)
-                paste_y = max(0, border_y)
-                
-                # Crop border content if necessary
-                if border_x < 0 or border_y < 0 or border_x + border_w > result_image.width or border_y + border_h > result_image.height:
-                    crop_left = max(0, -border_x)
-                    crop_top = max(0, -border_y)
-                    crop_right = min(border_w, result_image.width - border_x) if border_x >= 0 else border_w
-                    crop_bottom = min(border_h, result_image.height - border_y) if border_y >= 0 else border_h
-                    
-                    border_content_resized = border_content_resized.crop((crop_left, crop_top, crop_right, crop_bottom))
-                
-                # Create a temporary image to composite
-                temp_result = Image.new('RGB', result_image.size, (255, 255, 255))
-                temp_result.paste(border_content_resized, (paste_x, paste_y))
-                
-                # Blend with original page (border content as background, original on top)
-                # For areas outside the original image, use border content
-                # For the original image area, use original content
-                
-                # Create mask for original image area
-                mask = Image.new('L', result_image.size, 0)
-                mask_draw = ImageDraw.Draw(mask)
-                
-                # Original image bounds in image coordinates
-                orig_img_x = int(original_rect.x0 * scale_x)
-                orig_img_y = int(original_rect.y0 * scale_y)
-                orig_img_w = int((original_rect.x1 - original_rect.x0) * scale_x)
-                orig_img_h = int((original_rect.y1 - original_rect.y0) * scale_y)
-                
-                # Fill mask for original image area
-                mask_draw.rectangle([orig_img_x, orig_img_y, orig_img_x + orig_img_w, orig_img_y + orig_img_h], fill=255)
-                
-                # Composite: border content as background, original page on top using mask
-                result_image = Image.composite(result_image, temp_result, mask)
-                
-                return result_image
-            
-            else:
-                # Return original page if no center image
-                return self.extract_first_page_image(pdf_path)
-                
-        finally:
-            doc.close()
-    
-    def _find_center_image(self, page):
-        """
-        Find the center image on a PDF page
-        
-        Args:
-            page: PyMuPDF page object
-            
-        Returns:
-            dict: Image information or None
-        """
-        page_rect = page.rect
-        page_center_x = page_rect.width / 2
-        page_center_y = page_rect.height / 2
-        
-        # Get all images on page
-        image_list = page.get_images()
-        
-        if not image_list:
-            return None
-        
-        center_image = None
-        min_distance = float('inf')
-        
-        for img_index, img in enumerate(image_list):
-            # Get image rectangle
-            img_rects = page.get_image_rects(img[0])
-            
-            if img_rects:
-                img_rect = img_rects[0]  # Take first occurrence
-                
-                # Calculate center of image
-                img_center_x = img_rect.x0 + (img_rect.x1 - img_rect.x0) / 2
-                img_center_y = img_rect.y0 + (img_rect.y1 - img_rect.y0) / 2
-                
-                # Calculate distance from page center
-                distance = ((img_center_x - page_center_x) ** 2 + 
-                           (img_center_y - page_center_y) ** 2) ** 0.5
-                
-                # Check if image is reasonably large (not a small icon/logo)
-                img_width = img_rect.x1 - img_rect.x0
-                img_height = img_rect.y1 - img_rect.y0
-                min_size = min(page_rect.width, page_rect.height) * 0.2  # At least 20% of page
-                
-                if (distance < min_distance and 
-                    img_width > min_size and img_height > min_size):
-                    min_distance = distance
-                    center_image = {
-                        'index': img_index,
-                        'xref': img[0],
-                        'rect': img_rect,
-                        'width': img_width,
-                        'height': img_height
-                    }
-        
-        return center_image
-    
-    def _extract_image_from_page(self, page, image_info):
-        """
-        Extract image data from PDF page (for border generation only)
-        
-        Args:
-            page: PyMuPDF page object
-            image_info: Image information dict
-            
-        Returns:
-            PIL.Image: Extracted image
-        """
-        # Get image data
-        img_data = page.parent.extract_image(image_info['xref'])
-        img_bytes = img_data["image"]
-        
-        # Convert to PIL Image
-        image = Image.open(io.BytesIO(img_bytes))
-        
-        return image
-    
-    def _generate_border_content(self, page, image_info):
-        """
-        Generate border content from original image (without modifying original)
-        
-        Args:
-            page: PyMuPDF page object
-            image_info: Image information dict
-            
-        Returns:
-            PIL.Image: Border content image
-        """
-        # Extract original image (read-only)
-        original_image = self._extract_image_from_page(page, image_info)
-        
-        # Generate border content using image processor
-        border_width_mm = self.settings.get('border_width_mm', 3)
-        dpi = self.settings.get('output_dpi', 300)
-        
-        print(f"Generating border content: {border_width_mm}mm at {dpi} DPI")
-        
-        # Generate border content (original + stretched borders)
-        border_content = self.image_processor.generate_border_content(
-            original_image, border_width_mm, dpi)
-        
-        return border_content
-    
-    def _add_background_border_layer(self, page, image_info, border_content):
-        """
-        Add border content as BACKGROUND layer - don't touch original
-        
-        Args:
-            page: PyMuPDF page object
-            image_info: Original image information
-            border_content: PIL.Image - Generated border content
-        """
-        try:
-            # Get original image rectangle
-            original_rect = image_info['rect']
-            original_center_x = (original_rect.x0 + original_rect.x1) / 2
-            original_center_y = (original_rect.y0 + original_rect.y1) / 2
-            
-            # Calculate border expansion
-            border_width_mm = self.settings.get('border_width_mm', 3)
-            border_points = self._mm_to_points(border_width_mm)
-            
-            # Calculate background border rectangle (centered on original)
-            original_width = original_rect.x1 - original_rect.x0
-            original_height = original_rect.y1 - original_rect.y0
-            border_width = original_width + (2 * border_points)
-            border_height = original_height + (2 * border_points)
-            
-            # Center border content on original image position
-            border_rect = fitz.Rect(
-                original_center_x - border_width / 2,
-                original_center_y - border_height / 2,
-                original_center_x + border_width / 2,
-                original_center_y + border_height / 2
-            )
-            
-            # Ensure border doesn't go outside page boundaries
-            page_rect = page.rect
-            border_rect = border_rect & page_rect  # Intersection with page
-            
-            print(f"Background border placement:")
-            print(f"  Original image: {original_rect}")
-            print(f"  Border content: {border_rect}")
-            print(f"  Original stays: UNCHANGED")
-            
-            # Prepare border content for insertion
-            if border_content.mode in ('RGBA', 'LA'):
-                # Convert transparency to white background
-                background = Image.new('RGB', border_content.size, (255, 255, 255))
-                if border_content.mode == 'RGBA':
-                    background.paste(border_content, mask=border_content.split()[-1])
-                else:
-                    background.paste(border_content)
-                border_content = background
-            elif border_content.mode != 'RGB':
-                border_content = border_content.convert('RGB')
-            
-            # Save border content to buffer as PNG (lossless)
-            img_buffer = io.BytesIO()
-            border_content.save(img_buffer, format='PNG', optimize=True)
-            img_buffer.seek(0)
-            
-            # CRITICAL: Insert border content as BACKGROUND layer
-            # This goes BEHIND original image
-            page.insert_image(border_rect, stream=img_buffer.getvalue(), overlay=False)
-            
-            print("✓ Background border layer added successfully (PNG format)")
-            print("✓ Original image preserved in exact position")
-            
-        except Exception as e:
-            print(f"Error adding background border: {e}")
-    
-    def _generate_output_path(self, input_path):
-        """
-        Generate output file path based on settings
-        
-        Args:
-            input_path (str): Input file path
-            
-        Returns:
-            str: Output file path
-        """
-        input_path = Path(input_path)
-        
-        # Get suffix from settings
-        suffix = self.settings.get('filename_suffix', '_bordered')
-        
-        # Add timestamp if requested
-        if self.settings.get('include_timestamp', False):
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            suffix = f"{suffix}_{timestamp}"
-        
-        # Generate output filename
-        output_name = f"{input_path.stem}{suffix}{input_path.suffix}"
-        
-        # Use custom output directory if specified
-        if self.settings.get('use_output_directory', False):
-            output_dir = self.settings.get('output_directory', input_path.parent)
-            if output_dir:  # Only use if directory is actually set
-                output_path = Path(output_dir) / output_name
-            else:
-                output_path = input_path.parent / output_name
-        else:
-            output_path = input_path.parent / output_name
-        
-        return str(output_path)
-    
-    def _create_backup(self, input_path):
-        """
-        Create backup of original file
-        
-        Args:
-            input_path (str): Path to original file
-        """
-        input_path = Path(input_path)
-        backup_path = input_path.parent / f"{input_path.stem}_backup{input_path.suffix}"
-        
-        # Copy file
-        import shutil
-        shutil.copy2(input_path, backup_path)
-        print(f"Created backup: {backup_path.name}")
-    
-    def _add_processing_metadata(self, pdf_path):
-        """
-        Add processing information to PDF metadata (always preserve existing metadata)
-        
-        Args:
-            pdf_path (str): Path to processed PDF
-        """
-        doc = fitz.open(pdf_path)
-        try:
-            # Get existing metadata (always preserve)
-            metadata = doc.metadata
-            
-            # Add processing info
-            processing_info = f"Processed with PDF Border Tool on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-            processing_info += f" - Added {self.settings.get('border_width_mm', 3)}mm background border"
-            
-            # Update metadata while preserving existing
-            metadata['subject'] = processing_info
-            metadata['producer'] = 'PDF Border Tool'
-            
-            # Set updated metadata
-            doc.set_metadata(metadata)
-            doc.save(pdf_path, incremental=True)
-            
-        finally:
-            doc.close()
-    
-    def _mm_to_points(self, mm):
-        """
-        Convert millimeters to PDF points
-        
-        Args:
-            mm (float): Millimeters
-            
-        Returns:
-            float: Points
-        """
-        return mm * 2.834645669  # 1mm = 2.834645669 points
+"""
+PDF Processor - Adds background border layers without touching original content
+"""
+
+import os
+import fitz  # PyMuPDF
+import tempfile
+import io
+from pathlib import Path
+from PIL import Image, ImageEnhance, ImageDraw
+import numpy as np
+from datetime import datetime
+
+from core.image_processor import ImageProcessor
+
+# Optional: Numba compiles the center-pick kernel to native code for
+# image-dense batch jobs; plain NumPy is used when it is not installed
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _pick_center(rects, page_center_x, page_center_y, min_size):
+    """
+    Pick the index of the large image closest to the page center
+
+    Args:
+        rects (np.ndarray): (N, 4) float64 array of x0, y0, x1, y1 rows
+        page_center_x (float): Page center x in points
+        page_center_y (float): Page center y in points
+        min_size (float): Minimum width/height in points
+
+    Returns:
+        int: Row index of the chosen image, or -1 if none qualifies
+    """
+    widths = rects[:, 2] - rects[:, 0]
+    heights = rects[:, 3] - rects[:, 1]
+    center_x = rects[:, 0] + widths / 2
+    center_y = rects[:, 1] + heights / 2
+
+    distance_sq = ((center_x - page_center_x) ** 2 +
+                   (center_y - page_center_y) ** 2)
+
+    eligible = (widths > min_size) & (heights > min_size)
+    if not eligible.any():
+        return -1
+
+    distance_sq = np.where(eligible, distance_sq, np.inf)
+    return int(np.argmin(distance_sq))
+
+
+if njit is not None:
+    _pick_center = njit(cache=True)(_pick_center)
+
+
+def process_pdf_file(file_path, settings):
+    """
+    Process a single PDF file (module-level so it is picklable and can
+    run in process-pool workers)
+
+    Args:
+        file_path (str): Path to input PDF file
+        settings (dict): Plain settings dict
+
+    Returns:
+        str: Path to output PDF file
+    """
+    processor = PDFProcessor(settings)
+    return processor.process_pdf(file_path)
+
+
+class PDFProcessor:
+    """Main PDF processing class - background border approach"""
+    
+    def __init__(self, settings):
+        self.settings = settings
+        self.image_processor = ImageProcessor(settings)
+        
+    def process_pdf(self, input_path):
+        """
+        Main method to process a PDF file and add background borders
+        
+        Args:
+            input_path (str): Path to input PDF file
+            
+        Returns:
+            str: Path to output PDF file
+        """
+        print(f"Starting BACKGROUND BORDER processing: {Path(input_path).name}")
+        
+        # Generate output path
+        output_path = self._generate_output_path(input_path)
+        
+        # Create backup if requested
+        if self.settings.get('backup_original', True):
+            self._create_backup(input_path)
+        
+        # Open PDF document
+        doc = fitz.open(input_path)
+        
+        try:
+            # Process each page
+            for page_num in range(len(doc)):
+                page = doc[page_num]
+                
+                # Find center image on page
+                center_image = self._find_center_image(page)
+                
+                if center_image:
+                    print(f"Processing page {page_num + 1}: Found center image")
+                    
+                    # Generate border content from image
+                    border_content = self._generate_border_content(page, center_image)
+                    
+                    # Add border as BACKGROUND layer (don't touch original)
+                    self._add_background_border_layer(page, center_image, border_content)
+                    
+                else:
+                    print(f"Page {page_num + 1}: No center image found, skipping")
+            
+            # Save processed PDF
+            doc.save(output_path, garbage=4, deflate=True)
+            print(f"✓ Saved processed PDF: {Path(output_path).name}")
+            
+            # Add metadata if requested
+            if self.settings.get('add_processing_info', False):
+                self._add_processing_metadata(output_path)
+            
+            return output_path
+            
+        finally:
+            doc.close()
+    
+    def extract_first_page_image(self, pdf_path):
+        """
+        Extract first page as image for preview
+        
+        Args:
+            pdf_path (str): Path to PDF file
+            
+        Returns:
+            PIL.Image: First page as image
+        """
+        doc = fitz.open(pdf_path)
+        try:
+            return self._render_page_image(doc[0])
+        finally:
+            doc.close()
+
+    def _render_page_image(self, page):
+        """
+        Render a page to a PIL image at the configured DPI
+
+        Args:
+            page: PyMuPDF page object
+
+        Returns:
+            PIL.Image: Rendered page
+        """
+        dpi = self.settings.get('output_dpi', 300)
+        zoom = dpi / 72
+
+        # Previews pass a max dimension so we never rasterize far beyond
+        # what the screen can show (output processing leaves this unset)
+        preview_max_dim = self.settings.get('preview_max_dim')
+        if preview_max_dim:
+            page_max_pt = max(page.rect.width, page.rect.height)
+            if page_max_pt > 0:
+                zoom = min(zoom, preview_max_dim / page_max_pt)
+
+        mat = fitz.Matrix(zoom, zoom)
+        pix = page.get_pixmap(matrix=mat)
+
+        # Convert to PIL Image
+        img_data = pix.tobytes("ppm")
+        return Image.open(io.BytesIO(img_data))
+
+    def create_preview(self, pdf_path):
+        """
+        Create preview of processed image showing the full page result
+
+        Args:
+            pdf_path (str): Path to PDF file
+
+        Returns:
+            PIL.Image: Preview image showing full page with borders
+        """
+        doc = fitz.open(pdf_path)
+        try:
+            page = doc[0]
+            original_page_image = self._render_page_image(page)
+            return self._compose_preview(page, original_page_image)
+        finally:
+            doc.close()
+
+    def create_preview_pair(self, pdf_path, should_cancel=None):
+        """
+        Create the original and bordered preview images in one pass
+
+        Opens the document and rasterizes the first page once, sharing
+        the rendered image between both results instead of re-opening
+        and re-rendering per image.
+
+        Args:
+            pdf_path (str): Path to PDF file
+            should_cancel (callable): Optional zero-arg callable polled
+                between stages; returning True aborts the preview
+
+        Returns:
+            tuple: (PIL.Image original page, PIL.Image bordered preview),
+                or (None, None) if cancelled
+        """
+        doc = fitz.open(pdf_path)
+        try:
+            if should_cancel and should_cancel():
+                return None, None
+
+            page = doc[0]
+            original_page_image = self._render_page_image(page)
+
+            if should_cancel and should_cancel():
+                return None, None
+
+            processed_image = self._compose_preview(page, original_page_image)
+            return original_page_image, processed_image
+        finally:
+            doc.close()
+
+    def _compose_preview(self, page, original_page_image):
+        """
+        Compose the bordered preview onto an already-rendered page image
+
+        Args:
+            page: PyMuPDF page object
+            original_page_image (PIL.Image): Rendered page (read-only)
+
+        Returns:
+            PIL.Image: Preview with borders, or the original page image
+                if no center image was found
+        """
+        # Find center image
+        center_image = self._find_center_image(page)
+
+        if center_image:
+            dpi = self.settings.get('output_dpi', 300)
+
+            # Get original image for border generation
+            original_image = self._extract_image_from_page(page, center_image)
+                
+            # Generate border content
+            border_width_mm = self.settings.get('border_width_mm', 3)
+            border_content = self.image_processor.generate_border_content(
+                original_image, border_width_mm, dpi)
+                
+            # Calculate placement on page
+            original_rect = center_image['rect']
+            page_rect = page.rect
+                
+            # Convert PDF coordinates to image coordinates
+            scale_x = original_page_image.width / page_rect.width
+            scale_y = original_page_image.height / page_rect.height
+                
+            # Calculate border placement in image coordinates
+            border_width_points = self._mm_to_points(border_width_mm)
+                
+            # Original image position in page coordinates
+            orig_center_x = (original_rect.x0 + original_rect.x1) / 2
+            orig_center_y = (original_rect.y0 + original_rect.y1) / 2
+            orig_width = original_rect.x1 - original_rect.x0
+            orig_height = original_rect.y1 - original_rect.y0
+                
+            # Border content dimensions in page coordinates
+            border_width_page = orig_width + (2 * border_width_points)
+            border_height_page = orig_height + (2 * border_width_points)
+                
+            # Convert to image coordinates
+            border_x = int((orig_center_x - border_width_page/2) * scale_x)
+            border_y = int((orig_center_y - border_height_page/2) * scale_y)
+            border_w = int(border_width_page * scale_x)
+            border_h = int(border_height_page * scale_y)
+                
+            # Create result image (copy of original page)
+            result_image = original_page_image.copy()
+                
+            # Resize border content to fit placement area
+            border_content_resized = border_content.resize((border_w, border_h), Image.Resampling.LANCZOS)
+                
+            # Paste border content onto page (as background)
+            # Ensure we don't go outside image bounds
+            paste_x = max(0, border_x)
+            paste_y = max(0, border_y)
+                
+            # Crop border content if necessary
+            if border_x < 0 or border_y < 0 or border_x + border_w > result_image.width or border_y + border_h > result_image.height:
+                crop_left = max(0, -border_x)
+                crop_top = max(0, -border_y)
+                crop_right = min(border_w, result_image.width - border_x) if border_x >= 0 else border_w
+                crop_bottom = min(border_h, result_image.height - border_y) if border_y >= 0 else border_h
+                    
+                border_content_resized = border_content_resized.crop((crop_left, crop_top, crop_right, crop_bottom))
+                
+            # Create a temporary image to composite
+            temp_result = Image.new('RGB', result_image.size, (255, 255, 255))
+            temp_result.paste(border_content_resized, (paste_x, paste_y))
+                
+            # Blend with original page (border content as background, original on top)
+            # For areas outside the original image, use border content
+            # For the original image area, use original content
+                
+            # Create mask for original image area
+            mask = Image.new('L', result_image.size, 0)
+            mask_draw = ImageDraw.Draw(mask)
+                
+            # Original image bounds in image coordinates
+            orig_img_x = int(original_rect.x0 * scale_x)
+            orig_img_y = int(original_rect.y0 * scale_y)
+            orig_img_w = int((original_rect.x1 - original_rect.x0) * scale_x)
+            orig_img_h = int((original_rect.y1 - original_rect.y0) * scale_y)
+                
+            # Fill mask for original image area
+            mask_draw.rectangle([orig_img_x, orig_img_y, orig_img_x + orig_img_w, orig_img_y + orig_img_h], fill=255)
+                
+            # Composite: border content as background, original page on top using mask
+            result_image = Image.composite(result_image, temp_result, mask)
+                
+            return result_image
+
+        # Return the rendered page unchanged if no center image
+        return original_page_image
+    
+    def _find_center_image(self, page):
+        """
+        Find the center image on a PDF page
+        
+        Args:
+            page: PyMuPDF page object
+            
+        Returns:
+            dict: Image information or None
+        """
+        page_rect = page.rect
+        page_center_x = page_rect.width / 2
+        page_center_y = page_rect.height / 2
+        
+        # Get all images on page (full=True so get_image_bbox can resolve items)
+        image_list = page.get_images(full=True)
+
+        if not image_list:
+            return None
+
+        min_size = min(page_rect.width, page_rect.height) * 0.2  # At least 20% of page
+
+        # Common case: exactly one image (e.g. product/marketing PDFs) -
+        # skip the distance search entirely
+        if len(image_list) == 1:
+            return self._build_image_info(page, 0, image_list[0], min_size)
+
+        # If the first image already covers most of the page it is the
+        # center image - no smaller candidate can win the size filter
+        first_info = self._build_image_info(page, 0, image_list[0], min_size)
+        if (first_info and
+            first_info['width'] * first_info['height'] >
+                page_rect.width * page_rect.height * 0.8):
+            return first_info
+
+        # Resolve placements once, then run the geometry as one array pass
+        indices = []
+        rects = []
+        rect_rows = []
+
+        for img_index, img in enumerate(image_list):
+            img_rect = self._get_image_rect(page, img)
+
+            if img_rect:
+                indices.append(img_index)
+                rects.append(img_rect)
+                rect_rows.append((img_rect.x0, img_rect.y0,
+                                  img_rect.x1, img_rect.y1))
+
+        if not rect_rows:
+            return None
+
+        # Distance/size filter over all candidates in one kernel call
+        picked = _pick_center(np.array(rect_rows, dtype=np.float64),
+                              page_center_x, page_center_y, min_size)
+
+        if picked < 0:
+            return None
+
+        img_index = indices[picked]
+        img_rect = rects[picked]
+
+        return {
+            'index': img_index,
+            'xref': image_list[img_index][0],
+            'rect': img_rect,
+            'width': img_rect.x1 - img_rect.x0,
+            'height': img_rect.y1 - img_rect.y0
+        }
+
+    def _build_image_info(self, page, img_index, img, min_size):
+        """
+        Build the image-information dict for a single image, applying
+        the size filter
+
+        Args:
+            page: PyMuPDF page object
+            img_index (int): Index of the image on the page
+            img: Image item from page.get_images(full=True)
+            min_size (float): Minimum width/height in points
+
+        Returns:
+            dict: Image information or None if not displayed / too small
+        """
+        img_rect = self._get_image_rect(page, img)
+        if not img_rect:
+            return None
+
+        img_width = img_rect.x1 - img_rect.x0
+        img_height = img_rect.y1 - img_rect.y0
+
+        if img_width <= min_size or img_height <= min_size:
+            return None
+
+        return {
+            'index': img_index,
+            'xref': img[0],
+            'rect': img_rect,
+            'width': img_width,
+            'height': img_height
+        }
+
+    def _get_image_rect(self, page, img):
+        """
+        Get the placement rectangle of an image on a page
+
+        Uses get_image_bbox as a fast path (single content-stream lookup)
+        and falls back to get_image_rects for images placed multiple times.
+
+        Args:
+            page: PyMuPDF page object
+            img: Image item from page.get_images(full=True)
+
+        Returns:
+            fitz.Rect: Image rectangle or None
+        """
+        try:
+            img_rect = page.get_image_bbox(img)
+        except ValueError:
+            # Image referenced more than once - scan all occurrences
+            img_rects = page.get_image_rects(img[0])
+            if not img_rects:
+                return None
+            img_rect = img_rects[0]  # Take first occurrence
+
+        # get_image_bbox returns an invalid rect for undisplayed images
+        if img_rect.is_empty or img_rect.is_infinite:
+            return None
+
+        return img_rect
+
+    def _extract_image_from_page(self, page, image_info):
+        """
+        Extract image data from PDF page (for border generation only)
+        
+        Args:
+            page: PyMuPDF page object
+            image_info: Image information dict
+            
+        Returns:
+            PIL.Image: Extracted image
+        """
+        # Get image data
+        img_data = page.parent.extract_image(image_info['xref'])
+        img_bytes = img_data["image"]
+        
+        # Convert to PIL Image
+        image = Image.open(io.BytesIO(img_bytes))
+        
+        return image
+    
+    def _generate_border_content(self, page, image_info):
+        """
+        Generate border content from original image (without modifying original)
+        
+        Args:
+            page: PyMuPDF page object
+            image_info: Image information dict
+            
+        Returns:
+            PIL.Image: Border content image
+        """
+        # Extract original image (read-only)
+        original_image = self._extract_image_from_page(page, image_info)
+        
+        # Generate border content using image processor
+        border_width_mm = self.settings.get('border_width_mm', 3)
+        dpi = self.settings.get('output_dpi', 300)
+        
+        print(f"Generating border content: {border_width_mm}mm at {dpi} DPI")
+        
+        # Generate border content (original + stretched borders)
+        border_content = self.image_processor.generate_border_content(
+            original_image, border_width_mm, dpi)
+        
+        return border_content
+    
+    def _add_background_border_layer(self, page, image_info, border_content):
+        """
+        Add border content as BACKGROUND layer - don't touch original
+        
+        Args:
+            page: PyMuPDF page object
+            image_info: Original image information
+            border_content: PIL.Image - Generated border content
+        """
+        try:
+            # Get original image rectangle
+            original_rect = image_info['rect']
+            original_center_x = (original_rect.x0 + original_rect.x1) / 2
+            original_center_y = (original_rect.y0 + original_rect.y1) / 2
+            
+            # Calculate border expansion
+            border_width_mm = self.settings.get('border_width_mm', 3)
+            border_points = self._mm_to_points(border_width_mm)
+            
+            # Calculate background border rectangle (centered on original)
+            original_width = original_rect.x1 - original_rect.x0
+            original_height = original_rect.y1 - original_rect.y0
+            border_width = original_width + (2 * border_points)
+            border_height = original_height + (2 * border_points)
+            
+            # Center border content on original image position
+            border_rect = fitz.Rect(
+                original_center_x - border_width / 2,
+                original_center_y - border_height / 2,
+                original_center_x + border_width / 2,
+                original_center_y + border_height / 2
+            )
+            
+            # Ensure border doesn't go outside page boundaries
+            page_rect = page.rect
+            border_rect = border_rect & page_rect  # Intersection with page
+            
+            print(f"Background border placement:")
+            print(f"  Original image: {original_rect}")
+            print(f"  Border content: {border_rect}")
+            print(f"  Original stays: UNCHANGED")
+            
+            # Prepare border content for insertion
+            if border_content.mode in ('RGBA', 'LA'):
+                # Convert transparency to white background
+                background = Image.new('RGB', border_content.size, (255, 255, 255))
+                if border_content.mode == 'RGBA':
+                    background.paste(border_content, mask=border_content.split()[-1])
+                else:
+                    background.paste(border_content)
+                border_content = background
+            elif border_content.mode != 'RGB':
+                border_content = border_content.convert('RGB')
+            
+            # Save border content to buffer as PNG (lossless)
+            img_buffer = io.BytesIO()
+            border_content.save(img_buffer, format='PNG', optimize=True)
+            img_buffer.seek(0)
+            
+            # CRITICAL: Insert border content as BACKGROUND layer
+            # This goes BEHIND original image
+            # keep_proportion=False: border_rect is already sized exactly,
+            # so skip PyMuPDF's aspect-ratio fitting work
+            page.insert_image(border_rect, stream=img_buffer.getvalue(),
+                              keep_proportion=False, overlay=False)
+            
+            print("✓ Background border layer added successfully (PNG format)")
+            print("✓ Original image preserved in exact position")
+            
+        except Exception as e:
+            print(f"Error adding background border: {e}")
+    
+    def _generate_output_path(self, input_path):
+        """
+        Generate output file path based on settings
+        
+        Args:
+            input_path (str): Input file path
+            
+        Returns:
+            str: Output file path
+        """
+        input_path = Path(input_path)
+        
+        # Get suffix from settings
+        suffix = self.settings.get('filename_suffix', '_bordered')
+        
+        # Add timestamp if requested
+        if self.settings.get('include_timestamp', False):
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            suffix = f"{suffix}_{timestamp}"
+        
+        # Generate output filename
+        output_name = f"{input_path.stem}{suffix}{input_path.suffix}"
+        
+        # Use custom output directory if specified
+        if self.settings.get('use_output_directory', False):
+            output_dir = self.settings.get('output_directory', input_path.parent)
+            if output_dir:  # Only use if directory is actually set
+                output_path = Path(output_dir) / output_name
+            else:
+                output_path = input_path.parent / output_name
+        else:
+            output_path = input_path.parent / output_name
+        
+        return str(output_path)
+    
+    def _create_backup(self, input_path):
+        """
+        Create backup of original file
+        
+        Args:
+            input_path (str): Path to original file
+        """
+        input_path = Path(input_path)
+        backup_path = input_path.parent / f"{input_path.stem}_backup{input_path.suffix}"
+        
+        # Copy file
+        import shutil
+        shutil.copy2(input_path, backup_path)
+        print(f"Created backup: {backup_path.name}")
+    
+    def _add_processing_metadata(self, pdf_path):
+        """
+        Add processing information to PDF metadata (always preserve existing metadata)
+        
+        Args:
+            pdf_path (str): Path to processed PDF
+        """
+        doc = fitz.open(pdf_path)
+        try:
+            # Get existing metadata (always preserve)
+            metadata = doc.metadata
+            
+            # Add processing info
+            processing_info = f"Processed with PDF Border Tool on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+            processing_info += f" - Added {self.settings.get('border_width_mm', 3)}mm background border"
+            
+            # Update metadata while preserving existing
+            metadata['subject'] = processing_info
+            metadata['producer'] = 'PDF Border Tool'
+            
+            # Set updated metadata
+            doc.set_metadata(metadata)
+            doc.save(pdf_path, incremental=True)
+            
+        finally:
+            doc.close()
+    
+    def _mm_to_points(self, mm):
+        """
+        Convert millimeters to PDF points
+        
+        Args:
+            mm (float): Millimeters
+            
+        Returns:
+            float: Points
+        """
+        return mm * 2.834645669  # 1mm = 2.834645669 points
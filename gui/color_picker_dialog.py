@@ -7,30 +7,44 @@ import io
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, 
                             QLabel, QPushButton, QScrollArea, QWidget,
                             QMessageBox)
-from PyQt5.QtCore import Qt, QRect, QThread, pyqtSignal
+from PyQt5.QtCore import (Qt, QRect, QObject, QRunnable, QThreadPool,
+                          QTimer, pyqtSignal)
 from PyQt5.QtGui import QPixmap, QPainter, QCursor, QColor, QPen
 
 from core.pdf_processor import PDFProcessor
 
-class ImageLoadThread(QThread):
-    """Thread for loading PDF image in background"""
-    
+class ImageLoadSignals(QObject):
+    """Signal proxy for ImageLoadTask (QRunnable cannot emit signals itself)"""
+
     image_loaded = pyqtSignal(object)  # PIL Image
     error_occurred = pyqtSignal(str)
-    
+
+class ImageLoadTask(QRunnable):
+    """Pooled task for loading PDF image in background"""
+
     def __init__(self, file_path, settings):
         super().__init__()
         self.file_path = file_path
         self.settings = settings
-        
+        self.signals = ImageLoadSignals()
+        self.cancelled = False
+
+    def cancel(self):
+        """Request cooperative cancellation (no unsafe terminate())"""
+        self.cancelled = True
+
     def run(self):
         """Load image in background"""
         try:
+            if self.cancelled:
+                return
             processor = PDFProcessor(self.settings)
             image = processor.extract_first_page_image(self.file_path)
-            self.image_loaded.emit(image)
+            if not self.cancelled:
+                self.signals.image_loaded.emit(image)
         except Exception as e:
-            self.error_occurred.emit(str(e))
+            if not self.cancelled:
+                self.signals.error_occurred.emit(str(e))
 
 class ClickableImageLabel(QLabel):
     """Image label that responds to clicks for color picking"""
@@ -52,30 +66,44 @@ class ClickableImageLabel(QLabel):
         
         # Crosshair cursor for color picking
         self.setCursor(QCursor(Qt.CrossCursor))
-        
+
+        # Coalesce resize storms into one smooth rescale per settle
+        self._rescale_timer = QTimer(self)
+        self._rescale_timer.setSingleShot(True)
+        self._rescale_timer.timeout.connect(self.update_display)
+        self._scaled_for_size = None
+
     def set_image(self, pixmap):
         """Set the image for color picking"""
         self.original_pixmap = pixmap
+        self._scaled_for_size = None
         self.update_display()
-        
+
     def update_display(self):
         """Update the displayed image"""
         if self.original_pixmap:
-            # Scale image to fit label while maintaining aspect ratio
             available_size = self.size()
+
+            # Skip the smooth-scale pass if nothing changed
+            if self._scaled_for_size == available_size:
+                return
+            self._scaled_for_size = available_size
+
+            # Scale image to fit label while maintaining aspect ratio
             # Leave some margin
             display_size = available_size * 0.95
-            
+
             self.scaled_pixmap = self.original_pixmap.scaled(
-                int(display_size.width()), int(display_size.height()), 
+                int(display_size.width()), int(display_size.height()),
                 Qt.KeepAspectRatio, Qt.SmoothTransformation)
             self.setPixmap(self.scaled_pixmap)
-    
+
     def resizeEvent(self, event):
         """Handle resize events"""
         super().resizeEvent(event)
         if self.original_pixmap:
-            self.update_display()
+            # Rescale once per settle instead of per resize pixel
+            self._rescale_timer.start(16)
             
     def mousePressEvent(self, event):
         """Handle mouse clicks to pick colors"""
@@ -129,7 +157,7 @@ class ColorPickerDialog(QDialog):
         self.file_path = file_path
         self.settings = settings
         self.selected_color = None
-        self.image_load_thread = None
+        self.image_load_task = None
         
         self.init_ui()
         self.load_image()
@@ -249,11 +277,11 @@ class ColorPickerDialog(QDialog):
         layout.addLayout(button_layout)
         
     def load_image(self):
-        """Load PDF image in background thread"""
-        self.image_load_thread = ImageLoadThread(self.file_path, self.settings)
-        self.image_load_thread.image_loaded.connect(self.on_image_loaded)
-        self.image_load_thread.error_occurred.connect(self.on_load_error)
-        self.image_load_thread.start()
+        """Load PDF image on the shared thread pool"""
+        self.image_load_task = ImageLoadTask(self.file_path, self.settings)
+        self.image_load_task.signals.image_loaded.connect(self.on_image_loaded)
+        self.image_load_task.signals.error_occurred.connect(self.on_load_error)
+        QThreadPool.globalInstance().start(self.image_load_task)
         
     def on_image_loaded(self, pil_image):
         """Handle successful image loading"""
@@ -347,7 +375,6 @@ class ColorPickerDialog(QDialog):
         
     def closeEvent(self, event):
         """Handle dialog close"""
-        if self.image_load_thread and self.image_load_thread.isRunning():
-            self.image_load_thread.terminate()
-            self.image_load_thread.wait()
+        if self.image_load_task:
+            self.image_load_task.cancel()
         event.accept()
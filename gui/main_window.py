@@ -4,92 +4,201 @@ Main Window - Primary application interface
 
 import os
 import sys
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from PyQt5.QtWidgets import (QMainWindow, QVBoxLayout, QHBoxLayout, 
                             QWidget, QLabel, QFrame, QPushButton, 
                             QProgressBar, QTextEdit, QGroupBox,
                             QSpinBox, QDoubleSpinBox, QComboBox, QCheckBox, QSlider,
                             QLineEdit, QFileDialog, QMessageBox,
-                            QSplitter, QListWidget, QListWidgetItem, QColorDialog, QDialog)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer
+                            QSplitter, QListView, QColorDialog, QDialog)
+from PyQt5.QtCore import (Qt, QThread, QObject, QRunnable, QThreadPool,
+                          QAbstractListModel, QModelIndex, pyqtSignal, QTimer)
 from PyQt5.QtGui import QFont, QDragEnterEvent, QDropEvent, QPalette, QColor
 
-from core.pdf_processor import PDFProcessor
-from gui.preview_dialog import PreviewDialog
-from gui.color_picker_dialog import ColorPickerDialog
-from utils.validators import PDFValidator
+# Heavy modules (fitz/PIL via core.pdf_processor and utils.validators,
+# plus the secondary dialogs) are imported lazily at first use so the
+# main window paints without paying their cold-import cost
+
+class FileListModel(QAbstractListModel):
+    """List model for queued file paths, backed by a plain Python list"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._paths = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._paths)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if index.isValid() and role == Qt.DisplayRole:
+            return self._paths[index.row()]
+        return None
+
+    def add_paths(self, paths):
+        """Append a batch of paths with a single insert notification"""
+        if not paths:
+            return
+        first = len(self._paths)
+        self.beginInsertRows(QModelIndex(), first, first + len(paths) - 1)
+        self._paths.extend(paths)
+        self.endInsertRows()
+
+    def remove_rows(self, rows):
+        """
+        Remove multiple rows, batching contiguous runs into one notification
+
+        Args:
+            rows (list): Row indices sorted in descending order
+
+        Returns:
+            list: Removed paths
+        """
+        removed = []
+        i = 0
+        while i < len(rows):
+            last = rows[i]
+            first = last
+            while i + 1 < len(rows) and rows[i + 1] == first - 1:
+                i += 1
+                first = rows[i]
+            self.beginRemoveRows(QModelIndex(), first, last)
+            removed.extend(self._paths[first:last + 1])
+            del self._paths[first:last + 1]
+            self.endRemoveRows()
+            i += 1
+        return removed
+
+    def clear(self):
+        """Remove all paths"""
+        self.beginResetModel()
+        self._paths = []
+        self.endResetModel()
+
+    def path_at(self, row):
+        """Get the path at the given row"""
+        return self._paths[row]
+
+    def paths(self):
+        """Snapshot of all queued paths"""
+        return list(self._paths)
+
+    def count(self):
+        """Number of queued paths"""
+        return len(self._paths)
+
+def _warm_worker():
+    """Pool initializer: pay the heavy imports (fitz/PIL/cv2/numpy) at startup"""
+    import core.pdf_processor  # noqa: F401
+
+def _prewarm_heavy_imports():
+    """Idle-time import of the processing stack so first use doesn't stall"""
+    import core.pdf_processor  # noqa: F401
+    import utils.validators  # noqa: F401
+
+def _pool_noop():
+    """Picklable no-op task submitted only to force pool workers to spawn"""
+    pass
+
+def _is_pdf_path(path):
+    """Case-insensitive .pdf check without lowercasing the whole path"""
+    return path[-4:].lower() == ".pdf"
+
+# DropZone stylesheets - parsed by Qt once per state change, so build the
+# strings a single time at import instead of per drag event
+_DROP_STYLE_IDLE = """
+    QFrame {
+        border: 2px dashed #cccccc;
+        border-radius: 10px;
+        background-color: #f9f9f9;
+        min-height: 200px;
+    }
+    QFrame:hover {
+        border-color: #007acc;
+        background-color: #f0f8ff;
+    }
+"""
+
+_DROP_STYLE_ACTIVE = """
+    QFrame {
+        border: 2px solid #007acc;
+        border-radius: 10px;
+        background-color: #e6f3ff;
+        min-height: 200px;
+    }
+"""
+
+# Color swatch template - only the color token changes between calls
+_COLOR_DISPLAY_STYLE = "background-color: %s; border: 1px solid #999;"
 
 class DropZone(QFrame):
     """Drag and drop zone for PDF files"""
-    
+
     files_dropped = pyqtSignal(list)
-    
+
+    # Shared label font; built lazily so Qt's font matcher runs once
+    _label_font = None
+
     def __init__(self):
         super().__init__()
         self.init_ui()
-        
+
+    @classmethod
+    def _get_label_font(cls):
+        """Get the shared label font, creating it on first use"""
+        if cls._label_font is None:
+            cls._label_font = QFont("Arial", 14)
+        return cls._label_font
+
     def init_ui(self):
         """Initialize the drop zone UI"""
         self.setAcceptDrops(True)
         self.setFrameStyle(QFrame.StyledPanel)
-        self.setStyleSheet("""
-            QFrame {
-                border: 2px dashed #cccccc;
-                border-radius: 10px;
-                background-color: #f9f9f9;
-                min-height: 200px;
-            }
-            QFrame:hover {
-                border-color: #007acc;
-                background-color: #f0f8ff;
-            }
-        """)
+        self.setStyleSheet(_DROP_STYLE_IDLE)
+        self._drag_active = False
         
         layout = QVBoxLayout()
         
         # Drop zone label
         self.label = QLabel("📁 Drag & Drop PDF Files Here\n\nOr click to browse...")
         self.label.setAlignment(Qt.AlignCenter)
-        self.label.setFont(QFont("Arial", 14))
+        self.label.setFont(self._get_label_font())
         self.label.setStyleSheet("color: #666666; margin: 20px;")
         
         layout.addWidget(self.label)
         self.setLayout(layout)
         
+    @staticmethod
+    def _pdfs_from_mime(mime):
+        """Extract local PDF paths from drag-and-drop mime data"""
+        return [path for path in (url.toLocalFile() for url in mime.urls())
+                if _is_pdf_path(path)]
+
     def dragEnterEvent(self, event: QDragEnterEvent):
         """Handle drag enter events"""
         if event.mimeData().hasUrls():
-            urls = event.mimeData().urls()
-            pdf_files = [url.toLocalFile() for url in urls 
-                        if url.toLocalFile().lower().endswith('.pdf')]
-            if pdf_files:
+            # Short-circuit on the first PDF; the list is only built on drop
+            if any(_is_pdf_path(url.toLocalFile())
+                   for url in event.mimeData().urls()):
                 event.acceptProposedAction()
-                self.setStyleSheet("""
-                    QFrame {
-                        border: 2px solid #007acc;
-                        border-radius: 10px;
-                        background-color: #e6f3ff;
-                    }
-                """)
-        
+                # Only restyle on a real state change; each setStyleSheet
+                # call re-parses the QSS and repolishes the subtree
+                if not self._drag_active:
+                    self._drag_active = True
+                    self.setStyleSheet(_DROP_STYLE_ACTIVE)
+
     def dragLeaveEvent(self, event):
         """Handle drag leave events"""
-        self.setStyleSheet("""
-            QFrame {
-                border: 2px dashed #cccccc;
-                border-radius: 10px;
-                background-color: #f9f9f9;
-            }
-        """)
-        
+        if self._drag_active:
+            self._drag_active = False
+            self.setStyleSheet(_DROP_STYLE_IDLE)
+
     def dropEvent(self, event: QDropEvent):
         """Handle file drop events"""
-        files = []
-        for url in event.mimeData().urls():
-            file_path = url.toLocalFile()
-            if file_path.lower().endswith('.pdf'):
-                files.append(file_path)
-        
+        files = self._pdfs_from_mime(event.mimeData())
+
         if files:
             self.files_dropped.emit(files)
         
@@ -107,37 +216,104 @@ class DropZone(QFrame):
             if files:
                 self.files_dropped.emit(files)
 
+class ValidationSignals(QObject):
+    """Signal proxy for ValidationWorker (QRunnable cannot emit signals itself)"""
+
+    validated = pyqtSignal(str, bool, str)
+
+class ValidationWorker(QRunnable):
+    """Pooled task that validates a dropped PDF off the GUI thread"""
+
+    def __init__(self, validator, file_path):
+        super().__init__()
+        self.validator = validator
+        self.file_path = file_path
+        self.signals = ValidationSignals()
+
+    def run(self):
+        """Validate the file and report the result"""
+        is_valid, message = self.validator.validate_pdf(self.file_path)
+        self.signals.validated.emit(self.file_path, is_valid, message)
+
 class ProcessingThread(QThread):
     """Background thread for PDF processing"""
-    
-    progress_updated = pyqtSignal(int, str)
-    file_completed = pyqtSignal(str, bool, str)
+
     all_completed = pyqtSignal()
-    
-    def __init__(self, files, settings_dict):
+
+    def __init__(self, files, settings_dict, executor):
         super().__init__()
         self.files = files
-        self.settings_dict = settings_dict  # Store as dict
-        self.processor = PDFProcessor(settings_dict)  # Pass dict directly
-        
+        self.settings_dict = settings_dict  # Store as dict (picklable for workers)
+        self.executor = executor  # Long-lived pool owned by the main window
+        self._progress_lock = threading.Lock()
+        self._progress = (0, "")
+        self._cancel_event = threading.Event()
+        # Per-file results buffered here and drained by the GUI poll timer,
+        # so a burst of completions queues one timer tick instead of one
+        # signal delivery per file
+        self._completions = deque()
+
+    def cancel(self):
+        """Request cooperative cancellation of the remaining files"""
+        self._cancel_event.set()
+
+    def set_progress(self, value, message):
+        """Record the latest progress (read by the GUI poll timer)"""
+        with self._progress_lock:
+            self._progress = (value, message)
+
+    def latest_progress(self):
+        """Get the most recent (value, message) pair"""
+        with self._progress_lock:
+            return self._progress
+
+    def drain_completions(self):
+        """Pop all buffered per-file results (called from the GUI timer)"""
+        items = []
+        while True:
+            try:
+                items.append(self._completions.popleft())
+            except IndexError:
+                return items
+
     def run(self):
-        """Process files in background"""
+        """Process files in parallel across a process pool"""
+        from core.pdf_processor import process_pdf_file
+
         total_files = len(self.files)
-        
-        for i, file_path in enumerate(self.files):
+        completed = 0
+
+        self.set_progress(0, f"Processing {total_files} file(s)...")
+
+        # process_pdf is CPU-bound (rasterization + border generation), so
+        # spread files across the shared pool; each worker builds its own
+        # PDFProcessor
+        futures = {
+            self.executor.submit(process_pdf_file, file_path, self.settings_dict): file_path
+            for file_path in self.files
+        }
+
+        for future in as_completed(futures):
+            if self._cancel_event.is_set():
+                # Drop files that have not started; running ones finish
+                for pending in futures:
+                    pending.cancel()
+                self.set_progress(100, "Processing cancelled")
+                break
+
+            file_path = futures[future]
             try:
-                # Update progress
-                progress = int((i / total_files) * 100)
-                self.progress_updated.emit(progress, f"Processing: {Path(file_path).name}")
-                
-                # Process file
-                output_path = self.processor.process_pdf(file_path)
-                self.file_completed.emit(file_path, True, output_path)
-                
+                output_path = future.result()
+                self._completions.append((file_path, True, output_path))
             except Exception as e:
-                self.file_completed.emit(file_path, False, str(e))
-        
-        self.progress_updated.emit(100, "Processing complete!")
+                self._completions.append((file_path, False, str(e)))
+
+            completed += 1
+            progress = int((completed / total_files) * 100)
+            self.set_progress(progress, f"Completed: {os.path.basename(file_path)}")
+
+        if not self._cancel_event.is_set():
+            self.set_progress(100, "Processing complete!")
         self.all_completed.emit()
 
 class MainWindow(QMainWindow):
@@ -146,12 +322,41 @@ class MainWindow(QMainWindow):
     def __init__(self, config):
         super().__init__()
         self.config = config
-        self.validator = PDFValidator()
+        self.validator = None  # Built on first use (imports fitz/PIL)
         self.processing_thread = None
-        self.selected_color = QColor("#FFFFFF")  # Default white for solid color borders
-        
+        self._file_paths = set()  # Mirrors file_list for O(1) duplicate checks
+        self._pending_validations = 0
+        self._validated_batch = []  # Valid paths waiting for one bulk insert
+        self._invalid_batch = []  # Rejections collected for one summary dialog
+        self._failed_files = []  # Processing failures for the final summary
+        self._settings_cache = None  # Rebuilt lazily after any control change
+
+        # Long-lived worker pool, reused across batches; workers spawn
+        # lazily, so the idle-time prewarm below forces them up early
+        self._process_pool = ProcessPoolExecutor(
+            max_workers=os.cpu_count() or 1, initializer=_warm_worker)
+        self.selected_color = QColor(255, 255, 255)  # Default white for solid color borders
+
+        # Poll worker progress at ~20 Hz instead of repainting per file
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(50)
+        self._progress_timer.timeout.connect(self._poll_progress)
+
         self.init_ui()
-        
+
+        # Warm up once the event loop is idle, so the first drop/preview
+        # doesn't stall on cold imports or worker spawns
+        QTimer.singleShot(500, self._prewarm)
+
+    def _prewarm(self):
+        """Idle-time warmup: import the processing stack and spawn the
+        pool workers so the first batch pays neither cost at click time"""
+        _prewarm_heavy_imports()
+        # ProcessPoolExecutor only spawns workers on submit; one no-op
+        # per worker forces the spawns (and _warm_worker imports) now
+        for _ in range(os.cpu_count() or 1):
+            self._process_pool.submit(_pool_noop)
+
     def init_ui(self):
         """Initialize the user interface"""
         self.setWindowTitle("PDF Border Tool")
@@ -175,7 +380,20 @@ class MainWindow(QMainWindow):
         # Set splitter proportions
         splitter.setSizes([600, 400])
         main_layout.addWidget(splitter)
-        
+
+        # Any settings-control change drops the cached settings snapshot
+        for signal in (self.border_width.valueChanged,
+                       self.source_width.valueChanged,
+                       self.stretch_method.currentIndexChanged,
+                       self.dpi_slider.valueChanged,
+                       self.filename_suffix.textChanged,
+                       self.include_timestamp.toggled,
+                       self.use_custom_output.toggled,
+                       self.output_directory.textChanged,
+                       self.add_processing_info.toggled,
+                       self.backup_original.toggled):
+            signal.connect(self._invalidate_settings)
+
         # Status bar
         self.statusBar().showMessage("Ready - Drag PDF files to begin")
         
@@ -193,8 +411,18 @@ class MainWindow(QMainWindow):
         file_group = QGroupBox("Files to Process")
         file_layout = QVBoxLayout(file_group)
         
-        self.file_list = QListWidget()
+        self.file_model = FileListModel(self)
+        self.file_list = QListView()
+        self.file_list.setModel(self.file_model)
         self.file_list.setMinimumHeight(150)
+        # Rows are all single-line paths: uniform sizing + batched layout
+        # keep insertion and scrolling O(visible rows) on large queues
+        self.file_list.setUniformItemSizes(True)
+        self.file_list.setLayoutMode(QListView.Batched)
+        self.file_list.setBatchSize(256)
+        self.file_list.setResizeMode(QListView.Adjust)
+        self.file_list.setTextElideMode(Qt.ElideMiddle)
+        self.file_list.setSelectionMode(QListView.ExtendedSelection)
         file_layout.addWidget(self.file_list)
         
         # File list buttons
@@ -280,7 +508,7 @@ class MainWindow(QMainWindow):
         color_options_layout.addWidget(QLabel("Border Color:"))
         self.color_display = QPushButton()
         self.color_display.setFixedSize(30, 25)
-        self.color_display.setStyleSheet(f"background-color: {self.selected_color.name()}; border: 1px solid #999;")
+        self.color_display.setStyleSheet(_COLOR_DISPLAY_STYLE % self.selected_color.name())
         self.color_display.clicked.connect(self.pick_color_from_dialog)
         color_options_layout.addWidget(self.color_display)
         
@@ -298,16 +526,16 @@ class MainWindow(QMainWindow):
         quality_group = QGroupBox("Quality Settings")
         quality_layout = QVBoxLayout(quality_group)
         
-        # Output DPI
+        # Output DPI - single label carries both caption and value so the
+        # row needs one fewer widget
         dpi_layout = QHBoxLayout()
-        dpi_layout.addWidget(QLabel("Output DPI:"))
+        self.dpi_label = QLabel("Output DPI: 300")
+        dpi_layout.addWidget(self.dpi_label)
         self.dpi_slider = QSlider(Qt.Horizontal)
         self.dpi_slider.setRange(72, 300)
         self.dpi_slider.setValue(300)
         self.dpi_slider.valueChanged.connect(self.update_dpi_label)
-        self.dpi_label = QLabel("300 DPI")
         dpi_layout.addWidget(self.dpi_slider)
-        dpi_layout.addWidget(self.dpi_label)
         quality_layout.addLayout(dpi_layout)
         
         layout.addWidget(quality_group)
@@ -400,10 +628,17 @@ class MainWindow(QMainWindow):
         
         return panel
     
+    def _invalidate_settings(self, *args):
+        """Drop the cached settings snapshot (connected to control signals)"""
+        self._settings_cache = None
+
     def get_current_settings(self):
-        """Get current settings from UI controls"""
+        """Get current settings from UI controls (cached between changes)"""
+        if self._settings_cache is not None:
+            return self._settings_cache
+
         settings = {}
-        
+
         # Border settings
         settings['border_width_mm'] = float(self.border_width.value())
         settings['stretch_source_width_mm'] = float(self.source_width.value())
@@ -435,7 +670,8 @@ class MainWindow(QMainWindow):
         # Solid color settings
         if settings['stretch_method'] == 'solid_color':
             settings['solid_color'] = self.selected_color.name()
-        
+
+        self._settings_cache = settings
         return settings
     
     def on_stretch_method_changed(self, method):
@@ -464,23 +700,28 @@ class MainWindow(QMainWindow):
     def pick_color_from_dialog(self):
         """Pick color using color dialog"""
         color = QColorDialog.getColor(self.selected_color, self, "Choose Border Color")
-        if color.isValid():
+        # Skip the restyle (and settings rebuild) when nothing changed
+        if color.isValid() and color != self.selected_color:
             self.selected_color = color
-            self.color_display.setStyleSheet(f"background-color: {color.name()}; border: 1px solid #999;")
+            self._invalidate_settings()
+            self.color_display.setStyleSheet(_COLOR_DISPLAY_STYLE % color.name())
     
     def pick_color_from_image(self):
         """Pick color from image using a color picker dialog"""
-        if self.file_list.count() > 0:
-            first_file = self.file_list.item(0).text()
-            
+        if self.file_model.count() > 0:
+            from gui.color_picker_dialog import ColorPickerDialog
+
+            first_file = self.file_model.path_at(0)
+
             try:
                 # Create a color picker dialog
-                dialog = ColorPickerDialog(first_file, self.get_current_settings(), self)
+                dialog = ColorPickerDialog(first_file, dict(self.get_current_settings()), self)
                 if dialog.exec_() == QDialog.Accepted:
                     selected_color = dialog.get_selected_color()
-                    if selected_color:
+                    if selected_color and selected_color != self.selected_color:
                         self.selected_color = selected_color
-                        self.color_display.setStyleSheet(f"background-color: {selected_color.name()}; border: 1px solid #999;")
+                        self._invalidate_settings()
+                        self.color_display.setStyleSheet(_COLOR_DISPLAY_STYLE % selected_color.name())
             except Exception as e:
                 QMessageBox.warning(self, "Color Picker Error", f"Could not open color picker: {str(e)}")
                 # Fall back to color dialog
@@ -489,58 +730,106 @@ class MainWindow(QMainWindow):
             QMessageBox.information(self, "No Files", "Please add PDF files first to pick colors from images.")
         
     def add_files(self, files):
-        """Add files to the processing list"""
-        added_count = 0
-        
-        for file_path in files:
-            # Validate file
-            is_valid, message = self.validator.validate_pdf(file_path)
-            
-            if is_valid:
-                # Check if already in list
-                existing_items = [self.file_list.item(i).text() 
-                                for i in range(self.file_list.count())]
-                if file_path not in existing_items:
-                    item = QListWidgetItem(file_path)
-                    self.file_list.addItem(item)
-                    added_count += 1
-            else:
-                QMessageBox.warning(self, "Invalid File", 
-                                  f"Cannot add {Path(file_path).name}:\n{message}")
-        
-        if added_count > 0:
+        """Queue dropped files for validation off the GUI thread"""
+        new_files = [f for f in files if f not in self._file_paths]
+
+        if not new_files:
+            return
+
+        if self.validator is None:
+            from utils.validators import PDFValidator
+            self.validator = PDFValidator()
+
+        # Validation opens each PDF with PyMuPDF - run it on the shared
+        # pool so a big or slow-mount drop doesn't freeze the UI
+        self._pending_validations += len(new_files)
+        self.statusBar().showMessage(f"Validating {len(new_files)} file(s)...")
+
+        for file_path in new_files:
+            worker = ValidationWorker(self.validator, file_path)
+            worker.signals.validated.connect(self.on_file_validated)
+            QThreadPool.globalInstance().start(worker)
+
+    def on_file_validated(self, file_path, is_valid, message):
+        """Handle a validation result arriving from the worker pool"""
+        self._pending_validations -= 1
+
+        if is_valid:
+            # Re-check: the same path may have been dropped twice while pending
+            if file_path not in self._file_paths:
+                self._file_paths.add(file_path)
+                self._validated_batch.append(file_path)
+        else:
+            # Collect rejections for one summary dialog instead of a
+            # modal popup per file
+            self._invalid_batch.append(f"{os.path.basename(file_path)}: {message}")
+
+        if self._pending_validations == 0:
+            added_count = len(self._validated_batch)
+
+            if added_count > 0:
+                # Insert the whole batch in one model notification
+                self.file_model.add_paths(self._validated_batch)
+                self._validated_batch = []
+
+            if self._invalid_batch:
+                shown = self._invalid_batch[:10]
+                if len(self._invalid_batch) > len(shown):
+                    shown.append(f"...and {len(self._invalid_batch) - len(shown)} more")
+                QMessageBox.warning(self, "Invalid Files",
+                                  "Some files could not be added:\n\n" + "\n".join(shown))
+                self._invalid_batch = []
+
             self.update_ui_state()
-            self.statusBar().showMessage(f"Added {added_count} file(s)")
+            if added_count > 0:
+                self.statusBar().showMessage(f"Added {added_count} file(s)")
+            else:
+                self.statusBar().showMessage("No new files added")
         
     def clear_files(self):
         """Clear all files from the list"""
-        self.file_list.clear()
+        self.file_model.clear()
+        self._file_paths.clear()
         self.update_ui_state()
         self.statusBar().showMessage("File list cleared")
-        
+
     def remove_selected(self):
-        """Remove selected files from the list"""
-        current_row = self.file_list.currentRow()
-        if current_row >= 0:
-            self.file_list.takeItem(current_row)
-            self.update_ui_state()
-            self.statusBar().showMessage("File removed")
-            
+        """Remove all selected files from the list in one pass"""
+        rows = sorted({index.row() for index in self.file_list.selectedIndexes()},
+                      reverse=True)
+        if not rows:
+            return
+
+        removed = self.file_model.remove_rows(rows)
+        for path in removed:
+            self._file_paths.discard(path)
+
+        self.update_ui_state()
+        self.statusBar().showMessage(f"Removed {len(removed)} file(s)")
+
     def update_ui_state(self):
         """Update UI button states based on file list"""
-        has_files = self.file_list.count() > 0
+        has_files = self.file_model.count() > 0
         self.preview_btn.setEnabled(has_files)
         self.process_btn.setEnabled(has_files)
         
     def update_dpi_label(self, value):
         """Update DPI label when slider changes"""
-        self.dpi_label.setText(f"{value} DPI")
+        self.dpi_label.setText(f"Output DPI: {value}")
         
     def preview_changes(self):
         """Show preview of changes"""
-        if self.file_list.count() > 0:
-            first_file = self.file_list.item(0).text()
-            dialog = PreviewDialog(first_file, self.get_current_settings(), self)
+        if self.file_model.count() > 0:
+            from gui.preview_dialog import PreviewDialog
+
+            first_file = self.file_model.path_at(0)
+
+            # Render the preview at display resolution - the full-DPI
+            # rasterization only matters for actual output
+            preview_settings = dict(self.get_current_settings())
+            preview_settings['preview_max_dim'] = 1600
+
+            dialog = PreviewDialog(first_file, preview_settings, self)
             dialog.show()
     
     def _validate_settings(self, settings):
@@ -565,15 +854,17 @@ class MainWindow(QMainWindow):
             
     def process_files(self):
         """Start processing files"""
-        if self.file_list.count() == 0:
+        if self.file_model.count() == 0:
             QMessageBox.warning(self, "No Files", "Please add PDF files to process.")
             return
-            
-        files = [self.file_list.item(i).text() 
-                for i in range(self.file_list.count())]
+
+        files = self.file_model.paths()
         
         # Get current settings
-        current_settings = self.get_current_settings()
+        # Snapshot the settings so control changes made while the batch
+        # runs cannot leak into in-flight work (the copy is also what
+        # gets pickled for the pool workers)
+        current_settings = dict(self.get_current_settings())
         
         # Validate settings
         if not self._validate_settings(current_settings):
@@ -588,44 +879,71 @@ class MainWindow(QMainWindow):
         self.progress_label.setText("Starting processing...")
         
         # Start processing thread
-        self.processing_thread = ProcessingThread(files, current_settings)
-        self.processing_thread.progress_updated.connect(self.update_progress)
-        self.processing_thread.file_completed.connect(self.file_completed)
+        self._failed_files = []
+        self.processing_thread = ProcessingThread(files, current_settings,
+                                                  self._process_pool)
         self.processing_thread.all_completed.connect(self.processing_finished)
+        self._progress_timer.start()
         self.processing_thread.start()
-        
+
+    def _poll_progress(self):
+        """Flush the latest worker progress into the UI"""
+        if self.processing_thread:
+            value, message = self.processing_thread.latest_progress()
+            if message:
+                self.update_progress(value, message)
+            self._apply_completions(self.processing_thread.drain_completions())
+
     def update_progress(self, value, message):
         """Update progress bar and label"""
         self.progress_bar.setValue(value)
         self.progress_label.setText(message)
         self.statusBar().showMessage(message)
 
-    def file_completed(self, file_path, success, result):
-        """Handle completion of a single file"""
+    def _apply_completions(self, items):
+        """Apply a drained batch of per-file results in one UI pass"""
+        if not items:
+            return
+
+        for file_path, success, result in items:
+            if success:
+                print(f"Successfully processed: {file_path} → {result}")
+            else:
+                print(f"Error processing {file_path}: {result}")
+                self._failed_files.append((file_path, result))
+
+        # One status-bar update per batch, not per file
+        file_path, success, result = items[-1]
         if success:
-            self.statusBar().showMessage(f"✓ Completed: {Path(file_path).name}")
-            print(f"Successfully processed: {file_path} → {result}")
+            self.statusBar().showMessage(f"✓ Completed: {os.path.basename(file_path)}")
         else:
-            self.statusBar().showMessage(f"✗ Failed: {Path(file_path).name}")
-            print(f"Error processing {file_path}: {result}")
-            
-            # Show error dialog for failed files
-            QMessageBox.warning(self, "Processing Error", 
-                              f"Failed to process {Path(file_path).name}:\n{result}")
+            self.statusBar().showMessage(f"✗ Failed: {os.path.basename(file_path)}")
 
     def processing_finished(self):
         """Handle completion of all files"""
+        # Pick up any results completed since the last timer tick
+        if self.processing_thread:
+            self._apply_completions(self.processing_thread.drain_completions())
+        self._progress_timer.stop()
         self.progress_bar.setValue(100)
         self.progress_label.setText("All files completed!")
         self.statusBar().showMessage("Processing finished!")
-        
+
         # Re-enable controls
         self.process_btn.setEnabled(True)
         self.preview_btn.setEnabled(True)
-        
-        # Show completion message
-        QMessageBox.information(self, "Processing Complete", 
-                              "All files have been processed successfully!")
+
+        # Show completion message (failures summarized in one dialog)
+        if self._failed_files:
+            lines = [f"{os.path.basename(path)}: {error}"
+                     for path, error in self._failed_files[:10]]
+            if len(self._failed_files) > len(lines):
+                lines.append(f"...and {len(self._failed_files) - len(lines)} more")
+            QMessageBox.warning(self, "Processing Errors",
+                              "Some files failed to process:\n\n" + "\n".join(lines))
+        else:
+            QMessageBox.information(self, "Processing Complete",
+                                  "All files have been processed successfully!")
         
         # Reset progress after a delay
         QTimer.singleShot(3000, self.reset_progress)
@@ -634,3 +952,11 @@ class MainWindow(QMainWindow):
         """Reset progress bar and label"""
         self.progress_bar.setValue(0)
         self.progress_label.setText("Ready")
+
+    def closeEvent(self, event):
+        """Handle window close - wind down workers cleanly"""
+        if self.processing_thread and self.processing_thread.isRunning():
+            self.processing_thread.cancel()
+            self.processing_thread.wait(2000)
+        self._process_pool.shutdown(wait=False, cancel_futures=True)
+        event.accept()
@@ -2,16 +2,37 @@
 Preview Dialog - Split-view comparison with draggable divider and panning
 """
 
-import os  # 
+import os  #
+import threading
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, 
                             QLabel, QPushButton, QFrame, QSplitter,
                             QScrollArea, QWidget, QApplication)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QRect, QPoint
-from PyQt5.QtGui import QPixmap, QPainter, QCursor, QPen, QColor
-import io
+from PyQt5.QtCore import Qt, QThread, QTimer, pyqtSignal, QRect, QPoint
+from PyQt5.QtGui import (QPixmap, QPixmapCache, QPainter, QCursor, QPen,
+                         QColor, QImage)
 
 from core.pdf_processor import PDFProcessor
 
+def _pil_to_qimage(image):
+    """Convert a PIL image to QImage via its raw buffer
+
+    Safe to call off the GUI thread (QImage is, QPixmap is not), so the
+    per-pixel conversion cost lands on the worker.
+    """
+    if image.mode == 'RGB':
+        # Rendered PDF pages arrive as RGB - hand the buffer over
+        # without an alpha-channel expansion
+        data = image.tobytes('raw', 'RGB')
+        qimage = QImage(data, image.width, image.height,
+                        image.width * 3, QImage.Format_RGB888)
+    else:
+        rgba = image if image.mode == 'RGBA' else image.convert('RGBA')
+        data = rgba.tobytes('raw', 'RGBA')
+        qimage = QImage(data, rgba.width, rgba.height,
+                        rgba.width * 4, QImage.Format_RGBA8888)
+    # Qt does not own the Python buffer - copy before it goes away
+    return qimage.copy()
+
 class PreviewGeneratorThread(QThread):
     """Thread for generating preview images"""
     
@@ -22,20 +43,29 @@ class PreviewGeneratorThread(QThread):
         super().__init__()
         self.file_path = file_path
         self.settings = settings
-        
+        self.cancel_event = threading.Event()
+
     def run(self):
         """Generate preview images"""
         try:
             processor = PDFProcessor(self.settings)
-            
-            # Get original and preview images
-            original_image = processor.extract_first_page_image(self.file_path)
-            processed_image = processor.create_preview(self.file_path)
-            
-            self.preview_ready.emit(original_image, processed_image)
-            
+
+            # One document open + one page render shared by both images;
+            # the processor polls the cancel flag between stages
+            original_image, processed_image = processor.create_preview_pair(
+                self.file_path, should_cancel=self.cancel_event.is_set)
+
+            if self.cancel_event.is_set() or original_image is None:
+                return
+
+            # Convert to QImage here so the GUI thread only pays the
+            # cheap QPixmap.fromImage step
+            self.preview_ready.emit(_pil_to_qimage(original_image),
+                                    _pil_to_qimage(processed_image))
+
         except Exception as e:
-            self.error_occurred.emit(str(e))
+            if not self.cancel_event.is_set():
+                self.error_occurred.emit(str(e))
 
 class SplitViewWidget(QFrame):
     """Split view widget with draggable divider and panning support"""
@@ -52,12 +82,42 @@ class SplitViewWidget(QFrame):
         self.panning = False
         self.pan_start_pos = QPoint()
         self.pan_offset = QPoint(0, 0)
-        
+
+        # During rapid zooming, paint with fast pixmap transforms and
+        # refine with one smooth pass after the wheel idles for 150ms
+        self._interacting = False
+        self._idle_timer = QTimer(self)
+        self._idle_timer.setSingleShot(True)
+        self._idle_timer.timeout.connect(self._end_interaction)
+
+        # Wheel deltas accumulate here and are applied once per
+        # event-loop tick by _flush_zoom
+        self._pending_zoom_delta = 0
+        self._zoom_mouse_pos = QPoint()
+        self._zoom_scheduled = False
+
         self.setMinimumSize(600, 400)
         self.setFrameStyle(QFrame.StyledPanel)
-        
-        # Enable mouse tracking for cursor changes
+
+        # paintEvent covers the whole exposed area itself, so skip Qt's
+        # pre-paint background erase (one less full-widget fill per paint)
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
+        # Keep the double-buffered backing store; painting straight to
+        # screen would defeat Qt's paint merging and tear during drags
+        self.setAttribute(Qt.WA_PaintOnScreen, False)
+
+        # Enable mouse tracking for cursor changes; the current shape is
+        # tracked so plain hover motion doesn't re-set the cursor per event
         self.setMouseTracking(True)
+        self._cursor_shape = Qt.ArrowCursor
+
+        # Pens and brushes used on every paint, built once
+        self._divider_pen = QPen(QColor(0, 122, 204), 3)  # Blue divider
+        self._handle_color = QColor(0, 122, 204)
+        self._white_pen = QPen(Qt.white, 1)
+        self._black_pen = QPen(Qt.black, 1)
+        self._info_pen = QPen(QColor(100, 100, 100), 1)
         
     def set_images(self, original_pixmap, bordered_pixmap):
         """Set both images for comparison"""
@@ -71,68 +131,91 @@ class SplitViewWidget(QFrame):
         
         if not self.original_pixmap or not self.bordered_pixmap:
             painter = QPainter(self)
+            # With WA_OpaquePaintEvent set we own the background
+            painter.fillRect(self.rect(), self.palette().window())
             painter.drawText(self.rect(), Qt.AlignCenter, "Loading preview...")
             return
             
         painter = QPainter(self)
         rect = self.rect()
-        
+        # Only the exposed region needs pixels; divider drags request a
+        # narrow strip and everything outside it keeps its last frame
+        exposed = event.rect()
+
+        # Fill the letterbox area around the images (Qt no longer does
+        # the pre-paint erase for us)
+        painter.fillRect(exposed, self.palette().window())
+
         # Calculate divider position
         divider_x = int(rect.width() * self.divider_pos)
         
-        # Scale images to fit height while maintaining aspect ratio
+        # Scale at draw time instead of materializing zoomed pixmaps -
+        # at 5x zoom a pre-scaled copy would be 25x the original bytes.
+        # The clip keeps the resample cost proportional to visible pixels.
+        painter.setRenderHint(QPainter.SmoothPixmapTransform,
+                              not self._interacting)
+
+        # Target sizes that fit the height while maintaining aspect ratio
         available_height = rect.height()
-        original_scaled = self.original_pixmap.scaledToHeight(
-            int(available_height * self.zoom_factor), Qt.SmoothTransformation)
-        bordered_scaled = self.bordered_pixmap.scaledToHeight(
-            int(available_height * self.zoom_factor), Qt.SmoothTransformation)
-        
+        target_height = int(available_height * self.zoom_factor)
+        orig_width = self.original_pixmap.width() * target_height \
+            // max(1, self.original_pixmap.height())
+        border_width = self.bordered_pixmap.width() * target_height \
+            // max(1, self.bordered_pixmap.height())
+
         # Calculate base positions (centered, then apply pan offset)
-        orig_base_x = (rect.width() - original_scaled.width()) // 2
-        border_base_x = (rect.width() - bordered_scaled.width()) // 2
-        base_y = (rect.height() - original_scaled.height()) // 2
-        
+        orig_base_x = (rect.width() - orig_width) // 2
+        border_base_x = (rect.width() - border_width) // 2
+        base_y = (rect.height() - target_height) // 2
+
         # Apply pan offset
         orig_x = orig_base_x + self.pan_offset.x()
         border_x = border_base_x + self.pan_offset.x()
         y_pos = base_y + self.pan_offset.y()
-        
+
         # Draw original image (left side)
         if divider_x > 0:
-            left_rect = QRect(0, 0, divider_x, rect.height())
-            painter.setClipRect(left_rect)
-            painter.drawPixmap(orig_x, y_pos, original_scaled)
-        
+            left_rect = QRect(0, 0, divider_x, rect.height()).intersected(exposed)
+            if not left_rect.isEmpty():
+                painter.setClipRect(left_rect)
+                painter.drawPixmap(QRect(orig_x, y_pos, orig_width, target_height),
+                                   self.original_pixmap)
+
         # Draw bordered image (right side)
         if divider_x < rect.width():
-            right_rect = QRect(divider_x, 0, rect.width() - divider_x, rect.height())
-            painter.setClipRect(right_rect)
-            painter.drawPixmap(border_x, y_pos, bordered_scaled)
-        
-        # Draw divider line
+            right_rect = QRect(divider_x, 0, rect.width() - divider_x,
+                               rect.height()).intersected(exposed)
+            if not right_rect.isEmpty():
+                painter.setClipRect(right_rect)
+                painter.drawPixmap(QRect(border_x, y_pos, border_width, target_height),
+                                   self.bordered_pixmap)
+
         painter.setClipping(False)
-        pen = QPen(QColor(0, 122, 204), 3)  # Blue divider
-        painter.setPen(pen)
-        painter.drawLine(divider_x, 0, divider_x, rect.height())
-        
-        # Draw drag handle
+
+        # Draw divider line and drag handle (skipped when the exposed
+        # strip is away from the divider)
         handle_size = 20
-        handle_rect = QRect(divider_x - handle_size//2, rect.height()//2 - handle_size//2, 
-                           handle_size, handle_size)
-        painter.fillRect(handle_rect, QColor(0, 122, 204))
-        painter.setPen(QPen(Qt.white, 1))
-        painter.drawText(handle_rect, Qt.AlignCenter, "⋮⋮")
-        
+        if exposed.intersects(QRect(divider_x - handle_size // 2 - 2, 0,
+                                    handle_size + 4, rect.height())):
+            painter.setPen(self._divider_pen)
+            painter.drawLine(divider_x, 0, divider_x, rect.height())
+
+            handle_rect = QRect(divider_x - handle_size//2, rect.height()//2 - handle_size//2,
+                               handle_size, handle_size)
+            painter.fillRect(handle_rect, self._handle_color)
+            painter.setPen(self._white_pen)
+            painter.drawText(handle_rect, Qt.AlignCenter, "⋮⋮")
+
         # Draw labels
-        painter.setPen(QPen(Qt.black, 1))
+        painter.setPen(self._black_pen)
         if divider_x > 100:
             painter.drawText(10, 25, "ORIGINAL")
         if rect.width() - divider_x > 100:
             painter.drawText(divider_x + 10, 25, "WITH BORDER")
-            
+
         # Draw zoom and pan info
         info_text = f"Zoom: {self.zoom_factor:.1f}x • Right-click + drag to pan"
-        painter.setPen(QPen(QColor(100, 100, 100), 1))
+        painter.setPen(self._info_pen)
         painter.drawText(10, rect.height() - 10, info_text)
     
     def mousePressEvent(self, event):
@@ -146,7 +229,7 @@ class SplitViewWidget(QFrame):
             # Right click: start panning
             self.panning = True
             self.pan_start_pos = event.pos()
-            self.setCursor(QCursor(Qt.ClosedHandCursor))
+            self._set_cursor_shape(Qt.ClosedHandCursor)
     
     def mouseMoveEvent(self, event):
         """Handle mouse move for dragging divider or panning"""
@@ -168,38 +251,54 @@ class SplitViewWidget(QFrame):
             # Update cursor based on position
             if abs(event.x() - divider_x) < 10:
                 # Near divider
-                self.setCursor(QCursor(Qt.SizeHorCursor))
+                self._set_cursor_shape(Qt.SizeHorCursor)
             elif event.buttons() == Qt.NoButton:
                 # Not dragging anything
-                self.setCursor(QCursor(Qt.ArrowCursor))
-    
+                self._set_cursor_shape(Qt.ArrowCursor)
+
+    def _set_cursor_shape(self, shape):
+        """Set the cursor only when the shape actually changes"""
+        if shape != self._cursor_shape:
+            self._cursor_shape = shape
+            self.setCursor(QCursor(shape))
+
     def mouseReleaseEvent(self, event):
         """Handle mouse release"""
         if event.button() == Qt.LeftButton:
             self.dragging_divider = False
-            
+
         elif event.button() == Qt.RightButton:
             self.panning = False
-            
+
         # Reset cursor
-        self.setCursor(QCursor(Qt.ArrowCursor))
+        self._set_cursor_shape(Qt.ArrowCursor)
     
     def wheelEvent(self, event):
-        """Handle zoom with mouse wheel"""
-        delta = event.angleDelta().y()
-        zoom_in = delta > 0
-        
-        # Store mouse position for zoom centering
-        mouse_pos = event.pos()
-        
-        # Calculate zoom factor change
+        """Handle zoom with mouse wheel (coalesced per event-loop tick)"""
+        # Trackpads emit bursts of small wheel events; accumulate the
+        # deltas and apply them in one rescale on the next loop tick
+        self._pending_zoom_delta += event.angleDelta().y()
+        self._zoom_mouse_pos = event.pos()
+
+        if not self._zoom_scheduled:
+            self._zoom_scheduled = True
+            QTimer.singleShot(0, self._flush_zoom)
+
+    def _flush_zoom(self):
+        """Apply the accumulated wheel delta as a single zoom step"""
+        delta = self._pending_zoom_delta
+        mouse_pos = self._zoom_mouse_pos
+        self._pending_zoom_delta = 0
+        self._zoom_scheduled = False
+
+        if delta == 0:
+            return
+
+        # Calculate zoom factor change (one 1.25x step per notch)
         old_zoom = self.zoom_factor
-        
-        if zoom_in and self.zoom_factor < 5.0:
-            self.zoom_factor *= 1.25
-        elif not zoom_in and self.zoom_factor > 0.1:
-            self.zoom_factor /= 1.25
-            
+        steps = delta / 120.0
+        self.zoom_factor = max(0.1, min(5.0, self.zoom_factor * (1.25 ** steps)))
+
         # Adjust pan offset to zoom towards mouse position
         if old_zoom != self.zoom_factor:
             zoom_ratio = self.zoom_factor / old_zoom
@@ -216,13 +315,31 @@ class SplitViewWidget(QFrame):
             # Adjust pan to keep the same point under the mouse
             self.pan_offset.setX(int(self.pan_offset.x() * zoom_ratio - mouse_offset_x * (zoom_ratio - 1)))
             self.pan_offset.setY(int(self.pan_offset.y() * zoom_ratio - mouse_offset_y * (zoom_ratio - 1)))
-            
+
+            # Fast-scale while the wheel is spinning; the idle timer
+            # triggers the smooth re-render once it stops
+            self._interacting = True
+            self._idle_timer.start(150)
+
+        self.update()
+
+    def _end_interaction(self):
+        """Refine with a smooth-scaled repaint once zooming goes idle"""
+        self._interacting = False
         self.update()
     
     def update_divider_position(self, x):
         """Update divider position based on mouse x coordinate"""
-        self.divider_pos = max(0.1, min(0.9, x / self.rect().width()))
-        self.update()
+        width = self.rect().width()
+        old_x = int(width * self.divider_pos)
+        self.divider_pos = max(0.1, min(0.9, x / width))
+        new_x = int(width * self.divider_pos)
+
+        # Repaint only the strip the divider swept; pad it to cover the
+        # handle on the left and the "WITH BORDER" label on the right
+        left = min(old_x, new_x) - 14
+        strip = abs(new_x - old_x) + 28 + 120
+        self.update(QRect(left, 0, strip, self.height()))
         
     def reset_view(self):
         """Reset zoom and pan to default"""
@@ -247,13 +364,20 @@ class PreviewDialog(QDialog):
     """Dialog for previewing changes with split view and panning"""
     
     proceed_requested = pyqtSignal()  # Signal for proceeding with processing
-    
+
+    # Room for a handful of full previews in the global pixmap cache
+    _cache_limit_set = False
+
     def __init__(self, file_path, settings, parent=None):
         super().__init__(parent)
         self.file_path = file_path
         self.settings = settings
         self.preview_thread = None
         self.parent_window = parent
+
+        if not PreviewDialog._cache_limit_set:
+            QPixmapCache.setCacheLimit(256 * 1024)  # KB
+            PreviewDialog._cache_limit_set = True
         
         self.init_ui()
         self.generate_preview()
@@ -339,23 +463,51 @@ class PreviewDialog(QDialog):
         
         layout.addLayout(button_layout)
         
+    def _cache_keys(self):
+        """Build QPixmapCache keys from the file path and settings"""
+        settings_sig = hash(tuple(sorted(
+            (key, str(value)) for key, value in self.settings.items())))
+        base = f"{self.file_path}|{settings_sig}"
+        return base + "|orig", base + "|proc"
+
     def generate_preview(self):
-        """Generate preview images in background thread"""
+        """Generate preview images, reusing cached pixmaps when possible"""
+        # Re-opening the preview with unchanged settings is common - serve
+        # it from the pixmap cache instead of re-rendering the PDF
+        key_orig, key_proc = self._cache_keys()
+        original_pixmap = QPixmapCache.find(key_orig)
+        processed_pixmap = QPixmapCache.find(key_proc)
+        if original_pixmap is not None and processed_pixmap is not None:
+            self._show_pixmaps(original_pixmap, processed_pixmap)
+            return
+
         self.preview_thread = PreviewGeneratorThread(self.file_path, self.settings)
         self.preview_thread.preview_ready.connect(self.display_preview)
         self.preview_thread.error_occurred.connect(self.handle_error)
         self.preview_thread.start()
-        
+
     def display_preview(self, original_image, processed_image):
         """Display the generated preview images"""
         try:
             # Convert images to QPixmap
             original_pixmap = self.image_to_pixmap(original_image)
             processed_pixmap = self.image_to_pixmap(processed_image)
-            
+
+            key_orig, key_proc = self._cache_keys()
+            QPixmapCache.insert(key_orig, original_pixmap)
+            QPixmapCache.insert(key_proc, processed_pixmap)
+
+            self._show_pixmaps(original_pixmap, processed_pixmap)
+
+        except Exception as e:
+            self.handle_error(f"Error displaying preview: {str(e)}")
+
+    def _show_pixmaps(self, original_pixmap, processed_pixmap):
+        """Push a pair of pixmaps into the split view and info label"""
+        try:
             # Set images in split view
             self.split_view.set_images(original_pixmap, processed_pixmap)
-            
+
             # Update info
             border_width = self.settings.get('border_width_mm', 3)
             stretch_method = self.settings.get('stretch_method', 'edge_repeat').replace('_', ' ').title()
@@ -371,15 +523,12 @@ class PreviewDialog(QDialog):
             self.handle_error(f"Error displaying preview: {str(e)}")
             
     def image_to_pixmap(self, image):
-        """Convert PIL image to QPixmap"""
-        if hasattr(image, 'save'):  # PIL Image
-            buffer = io.BytesIO()
-            image.save(buffer, format='PNG')
-            buffer.seek(0)
-            
-            pixmap = QPixmap()
-            pixmap.loadFromData(buffer.getvalue())
-            return pixmap
+        """Convert a worker-produced image to QPixmap on the GUI thread"""
+        if isinstance(image, QImage):
+            # Native fromImage path, not the emulated QPixmap(QImage) ctor
+            return QPixmap.fromImage(image)
+        elif hasattr(image, 'tobytes'):  # PIL Image
+            return QPixmap.fromImage(_pil_to_qimage(image))
         else:
             # Assume it's already a QPixmap or similar
             return QPixmap(image)
@@ -398,7 +547,10 @@ class PreviewDialog(QDialog):
     def closeEvent(self, event):
         """Handle dialog close"""
         if self.preview_thread and self.preview_thread.isRunning():
-            self.preview_thread.terminate()
+            # Cooperative cancel - terminate() would leak the open
+            # fitz document and PIL buffers mid-render
+            self.preview_thread.cancel_event.set()
+            self.preview_thread.wait(1000)
         event.accept()
         
     def keyPressEvent(self, event):
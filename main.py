@@ -24,11 +24,7 @@ class PDFBorderApp(QApplication):
         self.setApplicationName("PDF Border Tool")
         self.setApplicationVersion("1.0.0")
         self.setOrganizationName("L'Oréal")
-        
-        # Set application properties
-        self.setAttribute(Qt.AA_EnableHighDpiScaling, True)
-        self.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
-        
+
         # Initialize configuration
         self.config = Config()
         
@@ -56,4 +52,9 @@ def main():
     return app.run()
 
 if __name__ == "__main__":
+    # Required for the frozen Windows build: process-pool workers spawned
+    # from the one-file executable re-run the entry point, and without
+    # this each worker would open another GUI window
+    import multiprocessing
+    multiprocessing.freeze_support()
     sys.exit(main())
@@ -2,42 +2,68 @@
 Validators - Input validation and file checking utilities
 """
 
+import functools
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import fitz  # PyMuPDF
 from PIL import Image
-import mimetypes
 
 class PDFValidator:
     """PDF file validation utilities"""
     
     def __init__(self):
         self.max_file_size = 100 * 1024 * 1024  # 100MB default
-        self.supported_versions = ['1.0', '1.1', '1.2', '1.3', '1.4', '1.5', '1.6', '1.7', '2.0']
     
-    def validate_pdf(self, file_path):
+    def validate_pdf(self, file_path, st=None):
         """
-        Comprehensive PDF validation
-        
+        Comprehensive PDF validation (cached per file state)
+
+        Results are cached keyed by (path, mtime, size) so re-dropping
+        the same folder doesn't re-open every PDF; a modified file gets
+        a different key and is re-validated automatically.
+
         Args:
             file_path (str): Path to PDF file
-            
+            st (os.stat_result): Optional pre-fetched stat, so callers
+                that already statted the file skip the extra syscall
+
+        Returns:
+            tuple: (is_valid: bool, message: str)
+        """
+        if st is None:
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                return False, "File does not exist"
+
+        return self._validate_cached(str(file_path), st.st_mtime_ns, st.st_size)
+
+    @functools.lru_cache(maxsize=2048)
+    def _validate_cached(self, file_path, mtime_ns, size):
+        """Cached wrapper - mtime/size are part of the key for invalidation"""
+        return self._do_validate(file_path, size)
+
+    def _do_validate(self, file_path, file_size):
+        """
+        Run the actual validation checks (existence is proven by the stat)
+
+        Args:
+            file_path (str): Path to PDF file
+            file_size (int): File size in bytes from the caller's stat
+
         Returns:
             tuple: (is_valid: bool, message: str)
         """
         try:
             file_path = Path(file_path)
-            
-            # Check if file exists
-            if not file_path.exists():
-                return False, "File does not exist"
-            
+
             # Check if file is readable
             if not os.access(file_path, os.R_OK):
                 return False, "File is not readable (permission denied)"
-            
-            # Check file size
-            file_size = file_path.stat().st_size
+
+            # Check file size (from the single stat done by the caller)
             if file_size > self.max_file_size:
                 size_mb = file_size / (1024 * 1024)
                 return False, f"File too large ({size_mb:.1f}MB). Maximum size: {self.max_file_size // (1024*1024)}MB"
@@ -45,15 +71,12 @@ class PDFValidator:
             if file_size == 0:
                 return False, "File is empty"
             
-            # Check file extension
+            # Check file extension; this already settles the MIME type
+            # (guess_type would only map the same .pdf suffix back to
+            # application/pdf after loading the system mimetypes DB)
             if file_path.suffix.lower() != '.pdf':
                 return False, "File does not have .pdf extension"
-            
-            # Check MIME type
-            mime_type, _ = mimetypes.guess_type(str(file_path))
-            if mime_type and mime_type != 'application/pdf':
-                return False, f"File MIME type is {mime_type}, expected application/pdf"
-            
+
             # Try to open with PyMuPDF
             try:
                 doc = fitz.open(str(file_path))
@@ -108,47 +131,90 @@ class PDFValidator:
             for page_num in range(min(3, doc.page_count)):  # Check first 3 pages
                 page = doc[page_num]
                 image_list = page.get_images()
-                
+
                 if image_list:
                     # Check if any image is reasonably large
                     page_rect = page.rect
                     min_size = min(page_rect.width, page_rect.height) * 0.1
-                    
+
                     for img in image_list:
+                        # Pixel dimensions come free in the get_images()
+                        # tuple; tiny bitmaps (icons, cut marks) can't be
+                        # the content image, so skip the content-stream
+                        # scan that get_image_rects would do for them
+                        if img[2] < 32 or img[3] < 32:
+                            continue
+
                         img_rects = page.get_image_rects(img[0])
                         if img_rects:
                             img_rect = img_rects[0]
                             img_width = img_rect.x1 - img_rect.x0
                             img_height = img_rect.y1 - img_rect.y0
-                            
+
                             if img_width > min_size and img_height > min_size:
                                 return True
-            
+
             return False
-            
+
         except Exception:
             return False
     
     def validate_batch(self, file_paths):
         """
-        Validate multiple PDF files
-        
+        Validate multiple PDF files in parallel
+
+        Validations run on a thread pool: PyMuPDF releases the GIL while
+        parsing, and going through validate_pdf keeps the shared result
+        cache warm for later single-file calls.
+
         Args:
             file_paths (list): List of file paths
-            
+
         Returns:
             dict: Validation results for each file
         """
         results = {}
-        
+        to_validate = []
+
         for file_path in file_paths:
-            is_valid, message = self.validate_pdf(file_path)
+            # One stat per file, shared between validation and the size field
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                results[file_path] = {
+                    'valid': False,
+                    'message': "File does not exist",
+                    'size': 0
+                }
+                continue
+            to_validate.append((file_path, st))
+
+        if not to_validate:
+            return results
+
+        if len(to_validate) == 1:
+            # No point spinning up a pool for a single file
+            file_path, st = to_validate[0]
+            is_valid, message = self.validate_pdf(file_path, st=st)
             results[file_path] = {
                 'valid': is_valid,
                 'message': message,
-                'size': Path(file_path).stat().st_size if Path(file_path).exists() else 0
+                'size': st.st_size
             }
-        
+            return results
+
+        max_workers = min(len(to_validate), os.cpu_count() or 2)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            outcomes = executor.map(
+                lambda item: self.validate_pdf(item[0], st=item[1]),
+                to_validate)
+            for (file_path, st), (is_valid, message) in zip(to_validate, outcomes):
+                results[file_path] = {
+                    'valid': is_valid,
+                    'message': message,
+                    'size': st.st_size
+                }
+
         return results
     
     def get_pdf_info(self, file_path):
@@ -186,7 +252,10 @@ class PDFValidator:
                     'height': page_rect.height,
                     'rotation': page.rotation,
                     'image_count': len(page.get_images()),
-                    'has_text': bool(page.get_text().strip())
+                    # Block-level extraction answers "any text?" without
+                    # assembling the page's full plain-text string
+                    'has_text': any(block[6] == 0
+                                    for block in page.get_text('blocks'))
                 }
                 
                 info['pages'].append(page_info)
@@ -203,7 +272,11 @@ class PDFValidator:
 
 class SettingsValidator:
     """Settings and input validation"""
-    
+
+    # Characters not allowed in filenames, compiled once so the suffix
+    # check is a single C-level scan
+    _INVALID_SUFFIX_RE = re.compile(r'[<>:"/\\|?*]')
+
     @staticmethod
     def validate_border_width(width):
         """
@@ -269,10 +342,9 @@ class SettingsValidator:
             return False, "_bordered", "Suffix cannot be empty"
         
         # Check for invalid filename characters
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            if char in suffix:
-                return False, "_bordered", f"Suffix contains invalid character: {char}"
+        match = SettingsValidator._INVALID_SUFFIX_RE.search(suffix)
+        if match:
+            return False, "_bordered", f"Suffix contains invalid character: {match.group()}"
         
         # Ensure suffix starts with underscore or dash for clarity
         if not suffix.startswith(('_', '-')):